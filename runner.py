@@ -1,9 +1,14 @@
+import concurrent.futures
+import functools
+import io
 import pygame
 import sys
-from wordle import WordleGame
-
-# Initialize pygame
-pygame.init()
+from wordle import (
+    WordleGame,
+    load_validation_cache,
+    query_dictionary_api,
+    save_validation_cache,
+)
 
 # Constants for colors, fonts, and window dimensions
 WINDOW_WIDTH, WINDOW_HEIGHT = 800, 600
@@ -15,9 +20,143 @@ INPUT_OUTLINE_COLOR = (224, 224, 224)  # Light Grey for input box outline
 EXACT_GUESS_COLOR = (129, 199, 132)  # Soft Green for exact letter matches
 CLOSE_GUESS_COLOR = (255, 235, 59)  # Muted Yellow for close letter matches
 WRONG_GUESS_COLOR = (239, 83, 80)  # Soft Red for incorrect letters
+# Letter box colors indexed by WordleGame status code (WRONG=0, CLOSE=1, EXACT=2)
+GUESS_COLORS = (WRONG_GUESS_COLOR, CLOSE_GUESS_COLOR, EXACT_GUESS_COLOR)
 OPEN_SANS = "assets/fonts/OpenSans-Regular.ttf"  # Path to OpenSans font
-FONT = pygame.font.Font(OPEN_SANS, 36)  # Default font for text
-TITLE_FONT = pygame.font.Font(OPEN_SANS, 48)  # Larger font for the game title
+FONT_SIZE = 36  # Default font size for text
+TITLE_FONT_SIZE = 48  # Larger font size for the game title
+IDLE_WAIT_TIMEOUT = 100  # Max milliseconds to block waiting for events on idle screens
+GAME_WAIT_TIMEOUT = 33  # Max milliseconds to block waiting for events in a game
+HANDLED_EVENTS = [  # Event types the game reacts to; everything else is blocked
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.KEYDOWN,
+    pygame.MOUSEMOTION,
+    pygame.WINDOWEXPOSED,
+]
+
+
+@functools.lru_cache(maxsize=None)
+def font_data():
+    """
+    Reads the OpenSans font file once.
+
+    Returns:
+        bytes: The contents of the TTF file at OPEN_SANS.
+    """
+    with open(OPEN_SANS, "rb") as font_file:
+        return font_file.read()
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(size):
+    """
+    Returns the OpenSans font at the given size.
+
+    Each size is loaded only once, and every font is parsed from the in-memory copy
+    of the TTF file instead of reopening it. Nothing is loaded until a font is first
+    needed, so importing this module does not touch the disk.
+
+    Args:
+        size (int): The font size, in points.
+
+    Returns:
+        pygame.font.Font: The loaded font.
+    """
+    return pygame.font.Font(io.BytesIO(font_data()), size)
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(font, text):
+    """
+    Renders text for a surface that is kept and blitted many times.
+
+    The surface is converted to the display's pixel format so later blits take the
+    fast path. Must only be called once the display mode has been set. Results are
+    cached, so repeated labels and messages are only rasterized once; callers must
+    not draw onto the returned surface.
+
+    Args:
+        font (pygame.font.Font): The font to render the text with.
+        text (str): The text to render.
+
+    Returns:
+        pygame.Surface: The rendered text with per-pixel alpha.
+    """
+    return font.render(text, True, TEXT_COLOR).convert_alpha()
+
+
+@functools.lru_cache(maxsize=256)
+def render_letter(letter, box_size):
+    """
+    Renders a guess log letter and works out where it sits in its letter box.
+
+    Results are cached, so each letter is rendered, and its centering offset
+    computed, once per box size. The cache is bounded because guesses may contain
+    any Unicode letter when the dictionary API is unavailable, but it holds the 26
+    ASCII letters for all 4 box sizes.
+
+    Args:
+        letter (str): The uppercase letter to render.
+        box_size (int): The size of a letter box, in pixels.
+
+    Returns:
+        tuple: The rendered letter and its (x, y) offset from the top left of the box.
+    """
+    surface = load_font(box_size * 19 // 20).render(letter, True, TEXT_COLOR)
+    offset = (
+        (box_size - surface.get_width()) // 2,
+        (box_size - surface.get_height()) // 2,
+    )
+    return surface, offset
+
+
+def render_button(size, label):
+    """
+    Pre-renders a button, including its outline and label, in both hover states.
+
+    Drawing a button then takes a single blit instead of two rect draws plus a
+    label blit. Must only be called once the display mode has been set.
+
+    Args:
+        size (tuple): The width and height of the button.
+        label (pygame.Surface): The rendered button text.
+
+    Returns:
+        tuple: The button surfaces in the normal and in the hovered state.
+    """
+    surfaces = []
+    for color in (BUTTON_COLOR, BUTTON_HOVER_COLOR):
+        surface = pygame.Surface(size).convert()
+        surface.fill(color)
+        pygame.draw.rect(surface, INPUT_OUTLINE_COLOR, surface.get_rect(), 2)
+        surface.blit(
+            label,
+            ((size[0] - label.get_width()) // 2, (size[1] - label.get_height()) // 2),
+        )
+        surfaces.append(surface)
+    return tuple(surfaces)
+
+
+def coalesce_rects(rects):
+    """
+    Merges overlapping rectangles so each damaged area is only updated once.
+
+    Args:
+        rects (list): A list of pygame.Rect objects describing damaged areas.
+
+    Returns:
+        list: A list of non-overlapping pygame.Rect objects covering the same areas.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
 
 
 class WordlePygame:
@@ -30,30 +169,143 @@ class WordlePygame:
     Attributes:
         screen (pygame.Surface): The main window surface where the game is displayed.
         clock (pygame.Clock): A pygame clock to control the game's frame rate.
+        font, title_font (pygame.font.Font): The default text font and the title font.
         wordle_game (WordleGame): An instance of the WordleGame class.
         current_screen (str): A string indicating the current screen or game state.
         input_box (pygame.Rect): A rectangle defining the input box area.
-        guess_log (list): A list to keep track of the guesses and their statuses.
-        validation_cache (dict): A cache for storing and retrieving validated words.
+        guess_log (list): A list of (guess, status bytearray) tuples for each scored guess.
+        validation_cache (dict): A cache with "valid" and "invalid" sets of words.
+        _dirty (bool): Whether the current screen needs a full redraw.
+        _hover_dirty (bool): Whether the main menu buttons need to be redrawn.
+        _damage (list): Screen areas changed since the last display update.
+        _regions (dict): The area each screen element was last drawn into.
+        _region_states (dict): The state each screen element was last drawn with.
+        _menu_bg (pygame.Surface): The pre-rendered static part of the main menu.
+        _title_surf, _instr_surf (pygame.Surface): Pre-rendered main menu headings.
+        _quit_button_surfs, _reset_button_surfs, _menu_return_button_surfs (tuple):
+            Pre-rendered (normal, hovered) button surfaces.
+        _size_buttons (list): A (rect, word size, region name, (normal, hovered)
+            surfaces) tuple for each main menu word size button.
+        _main_menu_hit_rects (list): The rect of each entry in _size_buttons followed
+            by the quit button rect, for hit-testing main menu clicks in one call.
+        _quit_button_rect (pygame.Rect): The rectangle of the main menu quit button.
+        _validation_pool (ThreadPoolExecutor): Runs dictionary API lookups off the UI
+            thread, one at a time. Only the main thread writes their results to the cache.
+        _pending_guess (tuple): The (guess, future) awaiting validation, or None.
+        _letter_box_size, _spacing, _log_width, _log_start_x, _log_start_y (int):
+            The guess log layout for the current word size.
+        _letter_x_offsets, _row_y_offsets (list): Precomputed guess log cell offsets.
+        _guess_log_surface (pygame.Surface): The pre-composed guess log, one row per guess.
+        _game_buttons (list): A (region name, rect, (normal, hovered) surfaces) tuple
+            for each game screen button.
+        _last_input_text, _last_input_surf, _last_input_rect: The last rendered input
+            text, its surface, and where it is drawn.
     """
 
     def __init__(self, cache):
         """
         Initializes the WordlePygame with a cache for word validation.
 
-        Sets up the pygame window, fonts, and initializes game-related attributes.
+        Initializes pygame, sets up the window and fonts, and initializes game-related
+        attributes. The window uses SDL's accelerated, vsynced renderer when it is
+        available.
 
         Args:
-            cache (dict): A cache for storing and retrieving validated words.
-        """
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            cache (dict): A cache with "valid" and "invalid" sets of words.
+        """
+        # Initialize pygame here rather than on import
+        pygame.init()
+        display_flags = pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            self.screen = pygame.display.set_mode(
+                (WINDOW_WIDTH, WINDOW_HEIGHT), display_flags, vsync=1
+            )
+        except pygame.error:
+            # Vsync is not supported by every driver; fall back to an unsynced window
+            self.screen = pygame.display.set_mode(
+                (WINDOW_WIDTH, WINDOW_HEIGHT), display_flags
+            )
         pygame.display.set_caption("Wordle")
+        # Stop SDL from queueing event types the game never looks at
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
+        self.font = load_font(FONT_SIZE)
+        self.title_font = load_font(TITLE_FONT_SIZE)
         self.wordle_game = None
         self.current_screen = "main_menu"
         self.input_box = None
+        self.text = ""
+        self.active = True  # Active state of input box
         self.guess_log = []
         self.validation_cache = cache
+        self._dirty = True
+        self._hover_dirty = False
+        self._damage = []
+        self._regions = {}
+        self._region_states = {}
+        self._validation_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_guess = None
+        self._last_input_text = None
+        self._last_input_surf = None
+        self._last_input_rect = None
+
+        # Static labels never change, so render them once up front
+        self._title_surf = render_text(self.title_font, "Wordle")
+        self._instr_surf = render_text(self.font, "Choose your word size to start")
+        self._menu_bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._menu_bg.fill(BACKGROUND_COLOR)
+        self.render_title(self._menu_bg)
+        self.render_instructions(self._menu_bg)
+        self._build_menu_layout()
+        self._build_game_layout()
+
+        # Buttons are static too, so compose each one once per hover state
+        self._quit_button_surfs = render_button(
+            self._quit_button_rect.size, render_text(self.font, "Quit")
+        )
+        self._reset_button_surfs = render_button(
+            self.reset_button.size, render_text(self.font, "Reset")
+        )
+        self._menu_return_button_surfs = render_button(
+            self.main_menu_button.size, render_text(self.font, "Menu")
+        )
+        self._game_buttons = [
+            ("reset_button", self.reset_button, self._reset_button_surfs),
+            ("menu_button", self.main_menu_button, self._menu_return_button_surfs),
+        ]
+
+    def _build_menu_layout(self):
+        """
+        Computes the main menu buttons once, as the layout never changes.
+
+        Each word size button is stored with its region name and pre-rendered
+        surfaces so that drawing and hit-testing allocate nothing per frame.
+        """
+        button_width, button_height = 100, 50
+        grid_start_x, grid_start_y = WINDOW_WIDTH // 2 - button_width - 10, 200
+        word_sizes = [5, 6, 7, 8]  # Available word sizes
+
+        self._size_buttons = []
+        for i, size in enumerate(word_sizes):
+            button_x = grid_start_x + (i % 2) * (button_width + 10)
+            button_y = grid_start_y + (i // 2) * (button_height + 10)
+            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+            surfaces = render_button(
+                button_rect.size, render_text(self.font, str(size))
+            )
+            self._size_buttons.append(
+                (button_rect, size, f"size_button_{size}", surfaces)
+            )
+
+        self._quit_button_rect = pygame.Rect(
+            grid_start_x,
+            grid_start_y + 2 * (button_height + 10),
+            2 * button_width + 10,
+            button_height,
+        )
+        self._main_menu_hit_rects = [button[0] for button in self._size_buttons]
+        self._main_menu_hit_rects.append(self._quit_button_rect)
 
     def main_menu(self):
         """
@@ -61,155 +313,241 @@ class WordlePygame:
 
         Displays the game title, instructions, and buttons for choosing the word size
         or quitting the game. Handles button click events to start the game or exit.
-        """
-        self.screen.fill(BACKGROUND_COLOR)
-        self.render_title()
-        self.render_instructions()
-        word_sizes = [5, 6, 7, 8]  # Available word sizes
-        buttons = self.render_word_size_buttons(word_sizes)
-        quit_button = self.render_quit_button()
-
-        for event in pygame.event.get():
+        The static part of the menu is pre-rendered and only blitted when the screen
+        is marked dirty, and only buttons whose hover state changed are redrawn;
+        otherwise it blocks until the next event arrives so that an idle menu does not
+        keep the CPU busy.
+        """
+        if self._dirty:
+            self.screen.blit(self._menu_bg, (0, 0))
+            self._damage = [self.screen.get_rect()]
+            self._regions.clear()
+            self._dirty = False
+            self._hover_dirty = True
+
+        if self._hover_dirty:
+            mouse_pos = pygame.mouse.get_pos()
+            self.render_word_size_buttons(mouse_pos)
+            self.render_quit_button(mouse_pos)
+            self.update_damaged()
+            self._hover_dirty = False
+
+        for event in self.wait_for_events(IDLE_WAIT_TIMEOUT):
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.quit_game()
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._dirty = True  # Window contents must be repainted
+            elif event.type in (pygame.MOUSEMOTION, pygame.KEYDOWN):
+                self._hover_dirty = True  # Hover state may have changed
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.handle_main_menu_click(event.pos, buttons, quit_button)
+                self._hover_dirty = True
+                self.handle_main_menu_click(event.pos)
+
+    def wait_for_events(self, timeout):
+        """
+        Blocks until an event arrives or the timeout expires, then drains the queue.
 
-        pygame.display.update()
+        The process sleeps inside SDL while waiting, so idle screens use no CPU.
 
-    def render_title(self):
+        Args:
+            timeout (int): The maximum time to wait for an event, in milliseconds.
+
+        Returns:
+            list: The pending events whose type is in HANDLED_EVENTS.
         """
-        Renders the game title at the top of the screen.
+        event = pygame.event.wait(timeout)
+        events = self.poll_events(pump=False)
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        return events
+
+    def poll_events(self, pump=True):
+        """
+        Returns the pending events that the game handles.
+
+        The queue is pumped at most once, filtered by type on the SDL side, and any
+        remaining unhandled events are discarded so they cannot accumulate.
+
+        Args:
+            pump (bool, optional): Whether to pump the event queue before reading it.
+
+        Returns:
+            list: The pending events whose type is in HANDLED_EVENTS.
         """
-        title = TITLE_FONT.render("Wordle", True, TEXT_COLOR)
-        self.screen.blit(title, (WINDOW_WIDTH / 2 - title.get_width() / 2, 30))
+        if pump:
+            pygame.event.pump()
+        events = pygame.event.get(HANDLED_EVENTS, pump=False)
+        pygame.event.clear(pump=False)
+        return events
 
-    def render_instructions(self):
+    def clear_region(self, name, rect):
         """
-        Renders instructions for the user on how to start the game.
+        Clears the area a screen element is about to be drawn into and marks it damaged.
+
+        The cleared area also covers where the element was last drawn, so content
+        that shrinks or moves does not leave stale pixels behind.
+
+        Args:
+            name (str): A key identifying the screen element.
+            rect (pygame.Rect): The area the element will be drawn into.
         """
-        instructions = FONT.render("Choose your word size to start", True, TEXT_COLOR)
-        self.screen.blit(
-            instructions, (WINDOW_WIDTH / 2 - instructions.get_width() / 2, 100)
-        )
+        previous = self._regions.get(name)
+        area = rect.union(previous) if previous else pygame.Rect(rect)
+        self.screen.fill(BACKGROUND_COLOR, area)
+        self._damage.append(area)
+        self._regions[name] = pygame.Rect(rect)
 
-    def render_word_size_buttons(self, word_sizes):
+    def mark_region(self, name, rect):
         """
-        Renders buttons for each available word size.
+        Records the area a screen element was drawn into and marks it damaged.
+
+        Args:
+            name (str): A key identifying the screen element.
+            rect (pygame.Rect): The area the element was drawn into.
+        """
+        self._damage.append(rect)
+        self._regions[name] = pygame.Rect(rect)
+
+    def region_changed(self, name, state):
+        """
+        Returns whether a screen element has to be redrawn, and records its new state.
+
+        An element is redrawn when the state it displays has changed, or when its area
+        was invalidated by a full repaint or an overlay since it was last drawn.
 
         Args:
-            word_sizes (list): A list of integers representing the available word sizes.
+            name (str): A key identifying the screen element.
+            state: The value the element displays; compared with the last drawn state.
 
         Returns:
-            dict: A dictionary mapping button rectangles to their corresponding word sizes.
+            bool: True if the element must be redrawn this frame.
         """
-        button_width, button_height = 100, 50
-        grid_start_x, grid_start_y = WINDOW_WIDTH / 2 - button_width - 10, 200
-        buttons = {}
+        if name in self._regions and self._region_states.get(name) == state:
+            return False
+        self._region_states[name] = state
+        return True
 
-        for i, size in enumerate(word_sizes):
-            button_x = grid_start_x + (i % 2) * (button_width + 10)
-            button_y = grid_start_y + (i // 2) * (button_height + 10)
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+    def update_damaged(self):
+        """
+        Pushes only the damaged areas of the screen to the display.
 
-            # Use a tuple of the rect's properties as the key for the button
-            button_key = (button_x, button_y, button_width, button_height)
-            buttons[button_key] = size
+        Overlapping areas are merged first, and the damage list is cleared afterwards.
+        """
+        if self._damage:
+            pygame.display.update(coalesce_rects(self._damage))
+            self._damage.clear()
 
-            # Change color on hover
-            if button_rect.collidepoint(pygame.mouse.get_pos()):
-                pygame.draw.rect(self.screen, BUTTON_HOVER_COLOR, button_rect)
-            else:
-                pygame.draw.rect(self.screen, BUTTON_COLOR, button_rect)
-            pygame.draw.rect(self.screen, INPUT_OUTLINE_COLOR, button_rect, 2)
-
-            # Draw button text
-            button_text = FONT.render(str(size), True, TEXT_COLOR)
-            self.screen.blit(
-                button_text,
-                (
-                    button_x + button_width / 2 - button_text.get_width() / 2,
-                    button_y + button_height / 2 - button_text.get_height() / 2,
-                ),
-            )
+    def render_title(self, surface):
+        """
+        Renders the game title at the top of the screen.
+
+        Args:
+            surface (pygame.Surface): The surface to render the title onto.
+        """
+        title = self._title_surf
+        surface.blit(title, ((WINDOW_WIDTH - title.get_width()) // 2, 30))
+
+    def render_instructions(self, surface):
+        """
+        Renders instructions for the user on how to start the game.
+
+        Args:
+            surface (pygame.Surface): The surface to render the instructions onto.
+        """
+        instructions = self._instr_surf
+        surface.blit(
+            instructions, ((WINDOW_WIDTH - instructions.get_width()) // 2, 100)
+        )
 
-        return buttons
+    def render_word_size_buttons(self, mouse_pos):
+        """
+        Renders buttons for each available word size.
 
-    def render_quit_button(self):
+        Args:
+            mouse_pos (tuple): The current mouse position, used for the hover effect.
+        """
+        for button_rect, _, name, (normal, hovered) in self._size_buttons:
+            # Change color on hover
+            hover = button_rect.collidepoint(mouse_pos)
+            if self.region_changed(name, hover):
+                self.screen.blit(hovered if hover else normal, button_rect)
+                self.mark_region(name, button_rect)
+
+    def render_quit_button(self, mouse_pos):
         """
         Renders a 'Quit' button on the main menu screen.
 
-        Returns:
-            pygame.Rect: A rectangle representing the position and size of the quit button.
+        Args:
+            mouse_pos (tuple): The current mouse position, used for the hover effect.
         """
-        button_width, button_height = 100, 50
-        grid_start_x, grid_start_y = WINDOW_WIDTH / 2 - button_width - 10, 200
-        quit_button = pygame.Rect(
-            grid_start_x,
-            grid_start_y + 2 * (button_height + 10),
-            2 * button_width + 10,
-            button_height,
-        )
+        quit_button = self._quit_button_rect
+        normal, hovered = self._quit_button_surfs
 
         # Change color on hover
-        if quit_button.collidepoint(pygame.mouse.get_pos()):
-            pygame.draw.rect(self.screen, BUTTON_HOVER_COLOR, quit_button)
-        else:
-            pygame.draw.rect(self.screen, BUTTON_COLOR, quit_button)
-        pygame.draw.rect(self.screen, INPUT_OUTLINE_COLOR, quit_button, 2)
-
-        quit_text = FONT.render("Quit", True, TEXT_COLOR)
-        self.screen.blit(
-            quit_text,
-            (
-                quit_button.x + quit_button.width / 2 - quit_text.get_width() / 2,
-                quit_button.y + button_height / 2 - quit_text.get_height() / 2,
-            ),
-        )
-
-        return quit_button
+        hover = quit_button.collidepoint(mouse_pos)
+        if self.region_changed("quit_button", hover):
+            self.screen.blit(hovered if hover else normal, quit_button)
+            self.mark_region("quit_button", quit_button)
 
-    def handle_main_menu_click(self, mouse_pos, buttons, quit_button):
+    def handle_main_menu_click(self, mouse_pos):
         """
         Handles click events on the main menu screen.
 
         Args:
             mouse_pos (tuple): The position of the mouse click.
-            buttons (dict): A dictionary mapping button rectangles to word sizes.
-            quit_button (pygame.Rect): The rectangle representing the quit button.
-        """
-        for button_key, size in buttons.items():
-            button_rect = pygame.Rect(button_key)
-            if button_rect.collidepoint(mouse_pos):
-                self.wordle_game = WordleGame(size, self.validation_cache)
-                self.wordle_game.guessed_words = set()
-                self.guess_log = []
-                self.current_screen = "game_screen"
-                return
+        """
+        # Hit-test every menu button in a single C-level call
+        index = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._main_menu_hit_rects)
+        if index == len(self._size_buttons):  # The quit button comes last
+            self.quit_game()
+        elif index != -1:
+            size = self._size_buttons[index][1]
+            self.wordle_game = WordleGame(size, self.validation_cache)
+            self.wordle_game.guessed_words = set()
+            self.guess_log = []
+            self._pending_guess = None
+            self._compute_log_layout()
+            self.text = ""
+            self.active = True
+            self.switch_screen("game_screen")
 
-        if quit_button.collidepoint(mouse_pos):
-            pygame.quit()
-            sys.exit()
+    def switch_screen(self, screen):
+        """
+        Switches to another screen and marks it for a full redraw.
+
+        Args:
+            screen (str): The name of the screen to show next.
+        """
+        self.current_screen = screen
+        self._dirty = True
 
     def game_screen(self):
         """
-        Manages the game screen where the actual Wordle game takes place.
+        Runs a single frame of the game screen where the actual Wordle game takes place.
 
-        Initializes UI elements and enters the main game loop.
+        Marks the whole screen damaged after a screen switch, so the next redraw clears
+        and repaints all of it, then waits for user input and finishes any validated
+        guess. The game display is only redrawn when something
+        happened, so an idle game screen sleeps instead of rendering frames.
         """
-        self.initialize_ui_elements()
-        self.game_loop()
+        if self._dirty:
+            self._damage = [self.screen.get_rect()]
+            self._regions.clear()
+            self._dirty = False
+
+        changed = self.handle_events()
+        changed = self.poll_pending_guess() or changed
+        if self.current_screen == "game_screen":
+            if changed or self._damage:
+                self.update_game_display()
+            self.clock.tick(30)  # Limit to 30 frames per second for consistent timing
 
-    def initialize_ui_elements(self):
+    def _build_game_layout(self):
         """
-        Initializes input box and buttons for the game screen.
+        Computes the input box and button rectangles for the game screen once.
         """
-        self.screen.fill(BACKGROUND_COLOR)
         # Input box setup
-        self.input_box = pygame.Rect(WINDOW_WIDTH / 2 - 100, 50, 200, 40)
-        self.text = ""
-        self.active = True  # Active state of input box
+        self.input_box = pygame.Rect(WINDOW_WIDTH // 2 - 100, 50, 200, 40)
 
         # Define button dimensions and positions
         button_width, button_height = 150, 50
@@ -228,34 +566,28 @@ class WordlePygame:
             button_height,
         )
 
-    def game_loop(self):
-        """
-        The main game loop, handling events and updating the game screen.
-
-        Continuously processes user input events and updates the display.
-        Exits the loop if the game screen changes.
-        """
-        while True:
-            self.handle_events()
-            if self.current_screen != "game_screen":
-                break  # Exit the loop if the screen should change
-            self.update_game_display()
-            self.clock.tick(30)  # Limit to 30 frames per second for consistent timing
-
     def handle_events(self):
         """
         Handles user input events like mouse clicks and keyboard inputs.
 
         Processes events related to quitting the game, clicking the mouse, and pressing keys.
         Manages the input for the game, including submitting guesses and navigating between screens.
+        Blocks for up to GAME_WAIT_TIMEOUT milliseconds when no events are pending.
+
+        Returns:
+            bool: True if any event was received.
         """
-        for event in pygame.event.get():
+        events = self.wait_for_events(GAME_WAIT_TIMEOUT)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.quit_game()
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._dirty = True  # Window contents must be repainted
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self.handle_mouse_click(event)
             elif event.type == pygame.KEYDOWN:
                 self.handle_key_press(event)
+        return bool(events)
 
     def handle_mouse_click(self, event):
         """
@@ -264,8 +596,8 @@ class WordlePygame:
         Args:
             event (pygame.Event): The event object containing information about the mouse click.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        if self.input_box.collidepoint(event.pos):
+        mouse_pos = event.pos
+        if self.input_box.collidepoint(mouse_pos):
             self.active = True
         elif self.reset_button.collidepoint(mouse_pos):
             # Reset game logic
@@ -273,7 +605,7 @@ class WordlePygame:
             self.active = True  # Activate the input box
             return
         elif self.main_menu_button.collidepoint(mouse_pos):
-            self.current_screen = "main_menu"
+            self.switch_screen("main_menu")
             return
         else:
             self.active = False
@@ -285,7 +617,7 @@ class WordlePygame:
         Args:
             event (pygame.Event): The event object containing information about the key press.
         """
-        if self.active:
+        if self.active and self._pending_guess is None:
             if event.key == pygame.K_RETURN:
                 self.process_guess()
             elif event.key == pygame.K_BACKSPACE:
@@ -293,60 +625,99 @@ class WordlePygame:
             else:
                 # Add character to input if it doesn't exceed word length
                 if len(self.text) < self.wordle_game.wordsize:
-                    self.text += event.unicode
+                    self.text += event.unicode.lower()  # Store the guess normalized
 
     def process_guess(self):
         """
         Processes the player's guess and updates the game state.
 
-        Validates the guess, updates the guess log, and checks the game's win/lose condition.
-        Displays messages for invalid inputs, repeated guesses, or game outcomes.
+        Checks the guess locally and then validates it. Cached words are validated
+        immediately; otherwise the dictionary API lookup runs on a background thread
+        and the guess is finished by poll_pending_guess once the lookup completes.
+        Displays messages for invalid inputs or repeated guesses.
         """
-        guess = self.text.lower()
-        if len(guess) == self.wordle_game.wordsize:
+        game = self.wordle_game
+        guess = self.text  # Already lowercase, see handle_key_press
+        if len(guess) == game.wordsize:
             if not guess.isalpha():
                 self.display_message("Invalid input! Use only letters.", 750)
                 self.text = ""
                 return
 
-            if guess in self.wordle_game.guessed_words:
+            if guess in game.guessed_words:
                 self.display_message(f"You have already guessed '{guess}'.", 750)
                 self.text = ""
                 return
-            self.wordle_game.guessed_words.add(guess)
-
-            if not self.wordle_game.is_valid_word(guess):
-                if self.wordle_game.api_available:
-                    self.display_message("Not a valid word. Try again.", 750)
-                else:
-                    self.display_message(
-                        [
-                            "API currently unavailable,",
-                            "continuing without word validation.",
-                        ],
-                        1500,
-                    )
+            game.guessed_words.add(guess)
 
-                self.text = ""
-                return
+            if not game.needs_lookup(guess):
+                # No network request needed, so validate synchronously
+                self.finish_guess(guess, game.is_valid_word(guess))
+            else:
+                future = self._validation_pool.submit(query_dictionary_api, guess)
+                self._pending_guess = (guess, future)
 
-            score, status = self.wordle_game.check_word(guess)
-            self.guess_log.append((guess, status))
-            self.text = ""  # Reset text
-            self.wordle_game.guesses -= 1
+    def poll_pending_guess(self):
+        """
+        Finishes the pending guess once its background validation has completed.
 
-            if score == self.wordle_game.EXACT * self.wordle_game.wordsize:
-                self.update_game_display()
-                self.display_message("You won!", 2000)
-                self.current_screen = "main_menu"
-                return
-            elif self.wordle_game.guesses == 0:
-                self.update_game_display()
+        Returns:
+            bool: True if a pending guess was finished.
+        """
+        if self._pending_guess is None:
+            return False
+        guess, future = self._pending_guess
+        if not future.done():
+            return False
+        self._pending_guess = None
+        self.finish_guess(
+            guess, self.wordle_game.record_lookup(guess, *future.result())
+        )
+        return True
+
+    def finish_guess(self, guess, valid):
+        """
+        Scores a validated guess and updates the game state.
+
+        Updates the guess log and checks the game's win/lose condition.
+        Displays messages for invalid words or game outcomes.
+
+        Args:
+            guess (str): The guessed word.
+            valid (bool): Whether the guess is a valid dictionary word.
+        """
+        if not valid:
+            if self.wordle_game.api_available:
+                self.display_message("Not a valid word. Try again.", 750)
+            else:
                 self.display_message(
-                    f"The word was {self.wordle_game.choice}. You lost!", 2000
+                    [
+                        "API currently unavailable,",
+                        "continuing without word validation.",
+                    ],
+                    1500,
                 )
-                self.current_screen = "main_menu"
-                return
+
+            self.text = ""
+            return
+
+        game = self.wordle_game
+        score, status = game.check_word(guess)
+        self.render_guess_row(guess, status, len(self.guess_log))
+        self.guess_log.append((guess, status))
+        self.text = ""  # Reset text
+        game.guesses -= 1
+
+        if score == game.win_score:
+            self.update_game_display()
+            self.display_message("You won!", 2000)
+            self.switch_screen("main_menu")
+            return
+        elif game.guesses == 0:
+            self.update_game_display()
+            self.display_message(f"The word was {game.choice}. You lost!", 2000)
+            self.switch_screen("main_menu")
+            return
 
     def update_game_display(self):
         """
@@ -354,56 +725,65 @@ class WordlePygame:
 
         Draws the input box, buttons, and the guess log on the screen.
         Also updates the display with the remaining number of guesses.
-        """
-        self.screen.fill(BACKGROUND_COLOR)
-        self.draw_buttons()
+        Elements whose content has not changed are skipped, and only the areas that
+        were drawn into are pushed to the display.
+        """
+        # Clear areas left over from overlays such as messages and redraw what they hid
+        for rect in self._damage:
+            self.screen.fill(BACKGROUND_COLOR, rect)
+            for name, area in list(self._regions.items()):
+                if area.colliderect(rect):
+                    del self._regions[name]
+        self.draw_buttons(pygame.mouse.get_pos())
         self.draw_input_box()
         # Display guess log and guess counter
         self.display_guess_log()
         self.display_guess_counter()
-        pygame.display.flip()
+        self.update_damaged()
 
-    def draw_buttons(self):
+    def draw_buttons(self, mouse_pos):
         """
         Draws buttons on the game screen, including the reset and main menu buttons.
 
         Changes button colors on hover and displays button text.
-        """
-        mouse_pos = pygame.mouse.get_pos()
 
-        # Loop through each button and draw
-        for button, text in [
-            (self.reset_button, "Reset"),
-            (self.main_menu_button, "Menu"),
-        ]:
-            if button.collidepoint(mouse_pos):
-                # Change color on hover
-                pygame.draw.rect(self.screen, BUTTON_HOVER_COLOR, button)
-            else:
-                pygame.draw.rect(self.screen, BUTTON_COLOR, button)
-
-            # Draw button outline
-            pygame.draw.rect(self.screen, INPUT_OUTLINE_COLOR, button, 2)
-
-            # Draw button text
-            text_surface = FONT.render(text, True, TEXT_COLOR)
-            text_x = button.x + (button.width - text_surface.get_width()) / 2
-            text_y = button.y + (button.height - text_surface.get_height()) / 2
-            self.screen.blit(text_surface, (text_x, text_y))
+        Args:
+            mouse_pos (tuple): The current mouse position, used for the hover effect.
+        """
+        # Loop through each button and redraw those whose hover state changed
+        for name, button, (normal, hovered) in self._game_buttons:
+            # Change color on hover
+            hover = button.collidepoint(mouse_pos)
+            if self.region_changed(name, hover):
+                self.screen.blit(hovered if hover else normal, button)
+                self.mark_region(name, button)
 
     def draw_input_box(self):
         """
         Draws the input box where the user types their guesses.
 
         Highlights the box when active and displays the current text input.
+        The box is only redrawn when the text or the active state has changed, and the
+        text is only re-rendered and re-positioned when it has changed.
         """
-        txt_surface = FONT.render(self.text, True, TEXT_COLOR)
-        # Align text in the center of the input box
-        text_x = self.input_box.x + (self.input_box.width - txt_surface.get_width()) / 2
-        text_y = (
-            self.input_box.y + (self.input_box.height - txt_surface.get_height()) / 2
-        )
-        self.screen.blit(txt_surface, (text_x, text_y))
+        if not self.region_changed("input_box", (self.text, self.active)):
+            return
+        if self.text != self._last_input_text:
+            txt_surface = render_text(self.font, self.text)
+            # Align text in the center of the input box
+            text_x = (
+                self.input_box.x + (self.input_box.width - txt_surface.get_width()) // 2
+            )
+            text_y = (
+                self.input_box.y
+                + (self.input_box.height - txt_surface.get_height()) // 2
+            )
+            self._last_input_surf = txt_surface
+            self._last_input_rect = txt_surface.get_rect(topleft=(text_x, text_y))
+            self._last_input_text = self.text
+        text_rect = self._last_input_rect
+        self.clear_region("input_box", self.input_box.union(text_rect))
+        self.screen.blit(self._last_input_surf, text_rect)
         box_color = BUTTON_HOVER_COLOR if self.active else INPUT_OUTLINE_COLOR
         pygame.draw.rect(self.screen, box_color, self.input_box, 2)
 
@@ -417,71 +797,111 @@ class WordlePygame:
         self.wordle_game = WordleGame(self.wordle_game.wordsize, self.validation_cache)
         self.wordle_game.guessed_words = set()
         self.guess_log = []
-        self.current_screen = "game_screen"
+        self._pending_guess = None
+        self._compute_log_layout()
+        self.switch_screen("game_screen")
 
     def quit_game(self):
         """
         Quits the game and exits.
 
-        Closes the pygame window and terminates the program.
+        Closes the pygame window, then waits for a running word validation to finish,
+        which the request timeout bounds, so that its result is cached. Queued lookups
+        are cancelled. Finally saves the validation cache and terminates the program.
         """
         pygame.quit()
+        self._validation_pool.shutdown(wait=True, cancel_futures=True)
+        if self._pending_guess is not None:
+            guess, future = self._pending_guess
+            if not future.cancelled():
+                self.wordle_game.record_lookup(guess, *future.result())
+        save_validation_cache(self.validation_cache)
         sys.exit()
 
+    def _compute_log_layout(self):
+        """
+        Computes the guess log layout once for the current word size.
+
+        Adjusts the size of the boxes based on the word length so the log fits on screen,
+        precomputes the letter and row offsets used when drawing the log, and creates
+        the empty surface the scored rows are composed onto.
+        """
+        wordsize = self.wordle_game.wordsize
+        # Dynamic adjustment based on word size
+        if wordsize <= 5:
+            self._letter_box_size, self._spacing = 40, 5
+        elif wordsize == 6:
+            self._letter_box_size, self._spacing = 35, 4
+        elif wordsize == 7:
+            self._letter_box_size, self._spacing = 30, 3
+        else:
+            self._letter_box_size, self._spacing = 25, 2
+
+        step = self._letter_box_size + self._spacing
+        self._log_width = (
+            wordsize * self._letter_box_size + (wordsize - 1) * self._spacing
+        )
+        self._log_start_x = WINDOW_WIDTH - self._log_width - 50  # Right alignment
+        self._log_start_y = 50  # Starting position of the guess log
+        self._letter_x_offsets = [i * step for i in range(wordsize)]
+        self._row_y_offsets = [i * step for i in range(self.wordle_game.guesses)]
+        log_height = self.wordle_game.guesses * step - self._spacing
+        self._guess_log_surface = pygame.Surface(
+            (self._log_width, log_height)
+        ).convert()
+        self._guess_log_surface.fill(BACKGROUND_COLOR)
+
+    def render_guess_row(self, guess, status, row):
+        """
+        Renders a single row of the guess log onto the guess log surface.
+
+        A row never changes once its guess has been scored, so it is rendered once
+        when the guess is submitted and the whole log is then blitted in one go.
+
+        Args:
+            guess (str): The guessed word.
+            status (bytearray): The status code for each letter in the guess.
+            row (int): The index of the row in the guess log.
+        """
+        letter_box_size = self._letter_box_size
+        log_surface = self._guess_log_surface
+        y = self._row_y_offsets[row]
+        letter_blits = []
+
+        for letter_index, letter in enumerate(guess):
+            # Look up the color for the status
+            color = GUESS_COLORS[status[letter_index]]
+
+            # Draw letter box
+            x = self._letter_x_offsets[letter_index]
+            log_surface.fill(color, (x, y, letter_box_size, letter_box_size))
+
+            # Queue the letter so the whole row is blitted in one call
+            letter_surface, (dx, dy) = render_letter(letter.upper(), letter_box_size)
+            letter_blits.append((letter_surface, (x + dx, y + dy)))
+
+        log_surface.blits(letter_blits, doreturn=False)
+
     def display_guess_log(self):
         """
         Renders the log of all guesses made by the player.
 
         For each guess, displays each letter in a colored box. The color indicates whether
         the letter is correct (green), in the wrong position (yellow), or not in the word (red).
-        Adjusts the size of the boxes based on the word length.
+        Each row is pre-rendered onto the guess log surface by render_guess_row, so this
+        is a single blit, done only after a guess has been added or the log area was
+        invalidated.
         """
-        # Dynamic adjustment based on word size
-        if self.wordle_game.wordsize <= 5:
-            letter_box_size = 40
-            spacing = 5
-        elif self.wordle_game.wordsize == 6:
-            letter_box_size = 35
-            spacing = 4
-        elif self.wordle_game.wordsize == 7:
-            letter_box_size = 30
-            spacing = 3
-        else:
-            letter_box_size = 25
-            spacing = 2
-
-        # Calculate the starting position dynamically
-        total_width = (
-            self.wordle_game.wordsize * letter_box_size
-            + (self.wordle_game.wordsize - 1) * spacing
+        if not self.region_changed(
+            "guess_log", (self.wordle_game, len(self.guess_log))
+        ):
+            return
+        log_height = len(self.guess_log) * (self._letter_box_size + self._spacing)
+        log_rect = pygame.Rect(
+            self._log_start_x, self._log_start_y, self._log_width, log_height
         )
-        log_start_x = WINDOW_WIDTH - total_width - 50  # Adjust for right alignment
-        log_start_y = 50  # Starting position of the guess log
-
-        for guess_index, (guess, status) in enumerate(self.guess_log):
-            for letter_index, letter in enumerate(guess):
-                # Determine the color based on the status
-                if status[letter_index] == self.wordle_game.EXACT:
-                    color = EXACT_GUESS_COLOR
-                elif status[letter_index] == self.wordle_game.CLOSE:
-                    color = CLOSE_GUESS_COLOR
-                else:
-                    color = WRONG_GUESS_COLOR
-
-                # Position of each letter box
-                x = log_start_x + letter_index * (letter_box_size + spacing)
-                y = log_start_y + guess_index * (letter_box_size + spacing)
-
-                # Draw letter box
-                letter_rect = pygame.Rect(x, y, letter_box_size, letter_box_size)
-                pygame.draw.rect(self.screen, color, letter_rect)
-
-                # Draw letter
-                dynamic_font = pygame.font.Font(OPEN_SANS, int(letter_box_size * 0.95))
-                letter_surface = dynamic_font.render(letter.upper(), True, TEXT_COLOR)
-                letter_x = x + (letter_box_size - letter_surface.get_width()) / 2
-                letter_y = y + (letter_box_size - letter_surface.get_height()) / 2
-                self.screen.blit(letter_surface, (letter_x, letter_y))
+        self.clear_region("guess_log", log_rect)
+        self.screen.blit(self._guess_log_surface, log_rect, ((0, 0), log_rect.size))
 
     def display_guess_counter(self):
         """
@@ -489,9 +909,14 @@ class WordlePygame:
 
         Shows the number of guesses left for the player at the top of the screen.
         Helps the player keep track of how many attempts they have remaining.
+        The counter is only redrawn when the number of guesses has changed, and each
+        count is rendered at most once thanks to the render_text cache.
         """
-        counter_text = f"Guesses left: {self.wordle_game.guesses}"
-        text_surface = FONT.render(counter_text, True, TEXT_COLOR)
+        guesses = self.wordle_game.guesses
+        if not self.region_changed("guess_counter", guesses):
+            return
+        text_surface = render_text(self.font, f"Guesses left: {guesses}")
+        self.clear_region("guess_counter", text_surface.get_rect(topleft=(10, 10)))
         self.screen.blit(text_surface, (10, 10))
 
     def display_message(self, message, wait_time=None, quit_after=False):
@@ -513,45 +938,47 @@ class WordlePygame:
         # Calculate the starting Y position for the message
         start_y = 350
         for line in message:
-            msg_surface = FONT.render(line, True, TEXT_COLOR)
+            msg_surface = render_text(self.font, line)
             # Center the message horizontally on the screen
-            self.screen.blit(
+            msg_rect = self.screen.blit(
                 msg_surface,
-                (WINDOW_WIDTH / 2 - msg_surface.get_width() / 2, start_y),
+                ((WINDOW_WIDTH - msg_surface.get_width()) // 2, start_y),
             )
+            self._damage.append(msg_rect)
             # Move to the next line position
-            start_y += FONT.size(line)[1] + 10
+            start_y += msg_surface.get_height() + 10
 
-        pygame.display.update()
+        # Keep the message areas damaged so the next frame clears them again
+        pygame.display.update(coalesce_rects(self._damage))
 
         # Wait for the specified time while processing events, if wait_time is provided
+        # Block in SDL until the next event or the deadline, whichever comes first
         if wait_time:
-            start_time = pygame.time.get_ticks()
+            deadline = pygame.time.get_ticks() + wait_time
             while True:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-                current_time = pygame.time.get_ticks()
-                if current_time - start_time >= wait_time:
+                remaining = deadline - pygame.time.get_ticks()
+                if remaining <= 0:
                     break
+                event = pygame.event.wait(remaining)
+                if event.type == pygame.QUIT:
+                    self.quit_game()
 
         # If quit_after is True, exit the game after displaying the message
         if quit_after:
-            pygame.quit()
-            sys.exit()
+            self.quit_game()
 
-        # If no wait_time is provided, transition to main menu after displaying the message
+        # If no wait_time is provided, transition to main menu after displaying the message;
+        # the loop in run() picks up the new screen, so there is no need to re-enter it
         if wait_time is None:
-            self.current_screen = "main_menu"
-            self.run()
+            self.switch_screen("main_menu")
 
     def run(self):
         """
         The main loop of the WordlePygame.
 
-        Continuously updates the screen and handles transitions between different screens
-        (main menu, game screen) based on the game state. Ensures the game runs at a consistent frame rate.
+        This is the only loop in the game: every iteration runs a single frame of the
+        current screen (main menu, game screen), so transitions between screens simply
+        take effect on the next iteration. Each screen presents its own frames.
         """
         while True:
             if self.current_screen == "main_menu":
@@ -559,18 +986,15 @@ class WordlePygame:
             elif self.current_screen == "game_screen":
                 self.game_screen()
 
-            # Update the display and tick the clock
-            pygame.display.flip()
-            self.clock.tick(30)  # Limit to 30 frames per second
-
 
 def main():
     """
     The entry point of the Wordle game application.
 
-    Initializes a validation cache and creates an instance of WordlePygame to start the game.
+    Loads the validation cache saved by earlier runs and creates an instance of
+    WordlePygame to start the game.
     """
-    validation_cache = {}  # Initialize the cache
+    validation_cache = load_validation_cache()
     game = WordlePygame(validation_cache)
     game.run()
 
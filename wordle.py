@@ -1,5 +1,151 @@
+import collections
+import functools
+import json
+import os
 import random
-import requests
+
+CACHE_PATH = os.path.expanduser("~/.wordle_cache.json")  # Persisted validation cache
+# Dictionary API endpoint; the word to look up is appended to it
+DICTIONARY_API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/"
+
+
+def new_validation_cache():
+    """
+    Creates an empty validation cache.
+
+    Returns:
+        dict: A cache with a "valid" and an "invalid" set of words.
+    """
+    return {"valid": set(), "invalid": set()}
+
+
+def load_validation_cache(path=CACHE_PATH):
+    """
+    Loads the validation cache saved by a previous run.
+
+    The file holds a JSON object with a "valid" and an "invalid" list of words.
+    Falls back to an empty cache if the file is missing, unreadable, or does not
+    have that shape.
+
+    Args:
+        path (str, optional): The file the cache is stored in.
+
+    Returns:
+        dict: A cache with a "valid" and an "invalid" set of words.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError, RecursionError):
+        return new_validation_cache()
+
+    cache = new_validation_cache()
+    if not isinstance(data, dict):
+        return cache
+    for key in cache:
+        words = data.get(key)
+        if not isinstance(words, list) or not all(isinstance(w, str) for w in words):
+            return new_validation_cache()
+        cache[key].update(words)
+    return cache
+
+
+def save_validation_cache(cache, path=CACHE_PATH):
+    """
+    Saves the validation cache so that later runs can skip repeated API lookups.
+
+    Args:
+        cache (dict): A cache with a "valid" and an "invalid" set of words.
+        path (str, optional): The file to store the cache in.
+    """
+    data = {key: sorted(words) for key, words in cache.items()}
+    try:
+        with open(path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+    except OSError as e:
+        print(f"Warning: Unable to save the validation cache ({e}).")
+
+
+@functools.lru_cache(maxsize=None)
+def api_session():
+    """
+    Returns the HTTP session shared by all dictionary API lookups.
+
+    The session keeps its connection to the API alive between lookups.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    import requests
+
+    return requests.Session()
+
+
+def query_dictionary_api(word):
+    """
+    Looks a word up in the dictionary API.
+
+    Reads and writes no game state, so it can run on a background thread. Pass the
+    result to WordleGame.record_lookup on the thread that owns the validation cache.
+
+    Args:
+        word (str): The word to look up.
+
+    Returns:
+        tuple: (valid, error). valid is True if the API knows the word, False if it
+            answered 404, or None if the lookup failed, in which case error says why.
+    """
+    # requests is only imported by the first lookup, as most runs answer every guess
+    # from the word list and the validation cache and never need it
+    try:
+        import requests
+    except ImportError as e:
+        return None, e
+
+    try:
+        response = api_session().get(DICTIONARY_API_URL + word, timeout=5)
+    except requests.RequestException as e:
+        return None, e
+    if response.status_code == 200:
+        return True, None
+    if response.status_code == 404:
+        return False, None
+    # Rate limits and server errors say nothing about the word, so are not cached
+    return None, f"unexpected status code {response.status_code}"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_words(filename, count):
+    """
+    Reads the first words of a word list file.
+
+    The result is cached, so every game after the first one of a given word size
+    reuses the list instead of reading the file again.
+
+    Args:
+        filename (str): The name of the file containing the word list.
+        count (int): The maximum number of words to read.
+
+    Returns:
+        tuple: The words, in file order.
+    """
+    with open(filename, "r") as wordlist:
+        return tuple(wordlist.read().split()[:count])
+
+
+@functools.lru_cache(maxsize=4)
+def _load_word_set(filename, count):
+    """
+    Returns the first words of a word list file as a set, for membership tests.
+
+    Args:
+        filename (str): The name of the file containing the word list.
+        count (int): The maximum number of words to read.
+
+    Returns:
+        frozenset: The words read by _load_words.
+    """
+    return frozenset(_load_words(filename, count))
 
 
 class WordList:
@@ -12,11 +158,12 @@ class WordList:
     Attributes:
         LISTSIZE (int): The number of words to be loaded from the file.
         wl_filename (str): The name of the file containing the word list.
-        options (list): A list of words loaded from the file.
-        cache (dict): A cache to store words for quick lookup.
+        options (tuple): The words loaded from the file, shared by all games of this size.
+        words (frozenset): The same words as options, for quick validity checks.
+        cache (dict): A cache with "valid" and "invalid" sets of words for quick lookup.
 
     Methods:
-        load_word_list(): Loads words from the file into the list and cache.
+        load_word_list(): Loads words from the file into the list.
         get_random_word(): Returns a random word from the list.
     """
 
@@ -28,29 +175,28 @@ class WordList:
 
         Args:
             wordsize (int): The size of the words to be loaded (e.g., 5 for five-letter words).
-            cache (dict): A cache to store and quickly retrieve words.
+            cache (dict): A cache with "valid" and "invalid" sets of words.
         """
         self.wl_filename = f"{wordsize}.txt"
-        self.options = []
+        self.options = ()
+        self.words = frozenset()
         self.cache = cache
         self.load_word_list()
 
     def load_word_list(self):
         """
-        Loads words from the file into the options list and the cache.
+        Loads words from the file into the options list and the words set.
 
-        Reads a fixed number of words from the file specified by wl_filename,
-        adding each word to the options list and the cache for quick access.
+        Reads up to a fixed number of words from the file specified by wl_filename,
+        or reuses them if an earlier game already did. The words are not added to the
+        cache, which only persists dictionary API results.
 
         Raises:
             RuntimeError: If there is an IOError while opening the file.
         """
         try:
-            with open(self.wl_filename, "r") as wordlist:
-                for _ in range(self.LISTSIZE):
-                    word = wordlist.readline().strip()
-                    self.options.append(word)
-                    self.cache[word] = True  # Add to cache
+            self.options = _load_words(self.wl_filename, self.LISTSIZE)
+            self.words = _load_word_set(self.wl_filename, self.LISTSIZE)
         except IOError:
             raise RuntimeError(f"Error opening file {self.wl_filename}.")
 
@@ -66,25 +212,32 @@ class WordleGame:
         EXACT (int): Constant value representing an exact letter match.
         CLOSE (int): Constant value representing a close letter match.
         WRONG (int): Constant value representing an incorrect letter.
+        STATUS_COLORS (tuple): ANSI background color codes indexed by status code.
         wordsize (int): The size of the target word.
         guessed_words (set): A set of words that have been guessed.
-        validation_cache (dict): A cache for validated words.
+        validation_cache (dict): A cache with "valid" and "invalid" sets of words.
         wordList (WordList): An instance of the WordList class.
         choice (str): The target word for the current game.
+        choice_counts (collections.Counter): The number of times each letter occurs in choice.
         guesses (int): The number of guesses allowed.
+        win_score (int): The score of a guess that matches every letter exactly.
         api_available (bool): Flag to indicate if the dictionary API is available.
 
     Methods:
         get_guess(): Prompts the user to input a guess.
         check_word(guess): Checks the guess against the target word.
         is_valid_word(word): Validates if a word is in the dictionary.
-        print_word(guess, status): Prints the guess with color-coded feedback.
+        needs_lookup(word): Checks if validating a word needs a dictionary API request.
+        record_lookup(word, valid, error): Caches a dictionary API lookup result.
+        print_word(guess, status, prefix): Prints the guess with color-coded feedback.
         start(): Starts the main game loop.
     """
 
     EXACT = 2
     CLOSE = 1
     WRONG = 0
+    # Red, yellow and green backgrounds, indexed by WRONG, CLOSE and EXACT
+    STATUS_COLORS = ("\033[1;37;41m", "\033[1;37;43m", "\033[1;37;42m")
 
     def __init__(self, wordsize, cache):
         """
@@ -92,7 +245,7 @@ class WordleGame:
 
         Args:
             wordsize (int): The size of the target word.
-            cache (dict): A cache for storing and retrieving validated words.
+            cache (dict): A cache with "valid" and "invalid" sets of words.
 
         Raises:
             ValueError: If the wordsize is not between 5 and 8 inclusive.
@@ -104,7 +257,9 @@ class WordleGame:
         self.validation_cache = cache
         self.wordList = WordList(wordsize, self.validation_cache)
         self.choice = random.choice(self.wordList.options)
+        self.choice_counts = collections.Counter(self.choice)  # Target letter counts
         self.guesses = wordsize + 1
+        self.win_score = self.EXACT * wordsize  # Score of a correct guess
         self.api_available = True
 
     def get_guess(self):
@@ -132,20 +287,24 @@ class WordleGame:
             guess (str): The guessed word.
 
         Returns:
-            tuple: A tuple containing the total score and a list of status for each letter.
+            tuple: A tuple containing the total score and a bytearray of status codes,
+                one for each letter.
         """
-        status = [self.WRONG] * self.wordsize
+        status = bytearray(self.wordsize)  # Zero-filled, so every letter starts WRONG
         score = 0
-        letter_counts = {c: self.choice.count(c) for c in set(self.choice)}
+        letter_counts = self.choice_counts.copy()
 
-        for i, char in enumerate(guess):
-            if char == self.choice[i]:
+        for i, (char, target) in enumerate(zip(guess, self.choice)):
+            if char == target:
                 status[i] = self.EXACT
                 score += self.EXACT
                 letter_counts[char] -= 1
 
-        for i, char in enumerate(guess):
-            if status[i] != self.EXACT and letter_counts.get(char, 0) > 0:
+        if score == self.win_score:
+            return score, status  # Every letter matched, nothing can be CLOSE
+
+        for i, (char, code) in enumerate(zip(guess, status)):
+            if code != self.EXACT and letter_counts[char] > 0:
                 status[i] = self.CLOSE
                 score += self.CLOSE
                 letter_counts[char] -= 1
@@ -156,8 +315,10 @@ class WordleGame:
         """
         Checks if a word is valid by querying a dictionary API or using a cache.
 
-        First checks the cache for the word. If not found, it queries the dictionary API.
-        Handles situations where the API is unavailable.
+        Words in the word list are always valid. Otherwise checks the cache for the
+        word, and if it is not found there, queries the dictionary API.
+        Only a 404 response marks a word as invalid; any other failure is handled as the
+        API being unavailable.
 
         Args:
             word (str): The word to validate.
@@ -165,24 +326,54 @@ class WordleGame:
         Returns:
             bool: True if the word is valid, False otherwise.
         """
-        # First, check the cache
-        if word in self.validation_cache:
-            return self.validation_cache[word]
+        # First, check the word list and the cache
+        if word in self.wordList.words or word in self.validation_cache["valid"]:
+            return True
+        if word in self.validation_cache["invalid"]:
+            return False
 
         if not self.api_available:
             # Skip API validation if it's marked as unavailable
             return True
 
-        try:
-            response = requests.get(
-                f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}", timeout=5
+        return self.record_lookup(word, *query_dictionary_api(word))
+
+    def needs_lookup(self, word):
+        """
+        Checks if validating a word needs a dictionary API request.
+
+        Args:
+            word (str): The word to validate.
+
+        Returns:
+            bool: True if the API is available and the word is in neither the word list
+                nor the cache.
+        """
+        return self.api_available and not (
+            word in self.wordList.words
+            or word in self.validation_cache["valid"]
+            or word in self.validation_cache["invalid"]
+        )
+
+    def record_lookup(self, word, valid, error):
+        """
+        Caches a dictionary API lookup result and returns whether the word is valid.
+
+        A failed lookup is not cached; instead API validation is disabled for the rest
+        of the session.
+
+        Args:
+            word (str): The word that was looked up.
+            valid (bool): The result from query_dictionary_api, or None if it failed.
+            error: What made the lookup fail, when valid is None.
+
+        Returns:
+            bool: True if the word is valid, False otherwise.
+        """
+        if valid is None:
+            print(
+                f"Warning: Unable to validate words using the dictionary API ({error})."
             )
-            valid = response.status_code == 200
-            self.validation_cache[word] = valid  # Cache the result
-            return valid
-        except (requests.Timeout, requests.RequestException) as e:
-            # Handle timeout and other request-related exceptions
-            print(f"Warning: Unable to validate words using the dictionary API ({e}).")
             print(
                 "Continuing without word validation. Please restart the program to try reconnecting."
             )
@@ -191,7 +382,11 @@ class WordleGame:
             )
             return False
 
-    def print_word(self, guess, status):
+        # Cache the result
+        self.validation_cache["valid" if valid else "invalid"].add(word)
+        return valid
+
+    def print_word(self, guess, status, prefix=""):
         """
         Prints the guessed word with color-coded feedback for each letter.
 
@@ -200,16 +395,15 @@ class WordleGame:
 
         Args:
             guess (str): The guessed word.
-            status (list): A list of status codes for each letter in the guess.
+            status (bytearray): The status code for each letter in the guess.
+            prefix (str): Text printed on the same line before the guess.
         """
-        for i in range(self.wordsize):
-            if status[i] == self.EXACT:
-                print(f"\033[1;37;42m{guess[i]}\033[0m", end="")
-            elif status[i] == self.CLOSE:
-                print(f"\033[1;37;43m{guess[i]}\033[0m", end="")
-            else:
-                print(f"\033[1;37;41m{guess[i]}\033[0m", end="")
-        print()
+        colors = self.STATUS_COLORS
+        # Build the whole line first so it is written in a single print call
+        line = prefix + "".join(
+            f"{colors[code]}{char}\033[0m" for char, code in zip(guess, status)
+        )
+        print(line)
 
     def start(self):
         """
@@ -238,10 +432,9 @@ class WordleGame:
 
             # Check the guess and update the game state
             score, status = self.check_word(guess)
-            print(f"Guess {_ + 1}: ", end="")
-            self.print_word(guess, status)
+            self.print_word(guess, status, f"Guess {_ + 1}: ")
 
-            if score == self.EXACT * self.wordsize:
+            if score == self.win_score:
                 print("You won!")
                 return
 
@@ -250,13 +443,15 @@ class WordleGame:
 
 def main():
     wordsize = input("Enter desired word size (5-8) to start: ")
+    validation_cache = load_validation_cache()  # Reuse results from earlier runs
     try:
         wordsize = int(wordsize)
-        validation_cache = {}  # Initialize the cache
         game = WordleGame(wordsize, validation_cache)
         game.start()
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        save_validation_cache(validation_cache)
 
 
 if __name__ == "__main__":